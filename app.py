@@ -53,6 +53,7 @@ def create_app():
     # Create database tables and default admin
     with app.app_context():
         db.create_all()
+        create_lookup_values()
         create_default_admin()
         
         # Create upload directory if it doesn't exist
@@ -78,6 +79,23 @@ def create_app():
 
 
 
+def create_lookup_values():
+    """Seed the status and internship type lookup tables"""
+    try:
+        from models import (ApplicationStatus, InternshipType,
+                            APPLICATION_STATUSES, INTERNSHIP_TYPES)
+        
+        for model, values in ((ApplicationStatus, APPLICATION_STATUSES),
+                              (InternshipType, INTERNSHIP_TYPES)):
+            existing = {row.id for row in model.query.all()}
+            for id_, code, label in values:
+                if id_ not in existing:
+                    db.session.add(model(id=id_, code=code, label=label))
+        db.session.commit()
+    except Exception as e:
+        print(f"Error seeding lookup tables: {str(e)}")
+        db.session.rollback()
+
 def create_default_admin():
     """Create default admin user if none exists"""
     try:
@@ -8,6 +8,7 @@ from flask_wtf.file import FileField, FileAllowed, FileRequired
 from wtforms import StringField, TextAreaField, SelectField, PasswordField, SubmitField
 from wtforms.validators import DataRequired, Email, Length, Optional, URL
 from wtforms.widgets import TextArea
+from models import APPLICATION_STATUSES, INTERNSHIP_TYPES
 
 class LoginForm(FlaskForm):
     """Admin login form"""
@@ -32,11 +33,7 @@ class InternshipApplicationForm(FlaskForm):
                                validators=[DataRequired()])
     
     internship_type = SelectField('Internship Domain',
-                                 choices=[('IT Solutions', 'IT Solutions'),
-                                         ('IoT Development', 'IoT Development'),
-                                         ('AI & Machine Learning', 'AI & Machine Learning'),
-                                         ('Full Stack Development', 'Full Stack Development'),
-                                         ('Data Science', 'Data Science')],
+                                 choices=[(code, code) for _, code, _ in INTERNSHIP_TYPES],
                                  validators=[DataRequired()])
     
     resume = FileField('Resume (PDF only)', 
@@ -62,10 +59,7 @@ class InternshipApplicationForm(FlaskForm):
 class ApplicationStatusForm(FlaskForm):
     """Form for updating application status"""
     status = SelectField('Status',
-                        choices=[('pending', 'Pending'),
-                                ('reviewed', 'Reviewed'),
-                                ('accepted', 'Accepted'),
-                                ('rejected', 'Rejected')],
+                        choices=[(code, label) for _, code, label in APPLICATION_STATUSES],
                         validators=[DataRequired()])
     
     notes = TextAreaField('Admin Notes', 
@@ -0,0 +1,160 @@
+"""Lookup tables for application status and internship type
+
+Replaces the free-text internship_applications.status and
+internship_type columns with small integer foreign keys into the
+application_statuses and internship_types lookup tables.
+
+Databases created by db.create_all() before this revision have no
+alembic_version table; this is the first revision, so running
+`flask db upgrade` converts them in place. Databases created after it
+already have the new schema and only need `flask db stamp head`.
+
+Revision ID: 3f9c2a7d41b8
+Revises:
+Create Date: 2026-10-19 10:12:04.318517
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9c2a7d41b8'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Snapshot of models.APPLICATION_STATUSES / INTERNSHIP_TYPES at this revision
+APPLICATION_STATUSES = (
+    (1, 'pending', 'Pending'),
+    (2, 'reviewed', 'Reviewed'),
+    (3, 'accepted', 'Accepted'),
+    (4, 'rejected', 'Rejected'),
+)
+
+INTERNSHIP_TYPES = (
+    (1, 'IT Solutions', 'IT Solutions'),
+    (2, 'IoT Development', 'IoT Development'),
+    (3, 'AI & Machine Learning', 'AI & ML'),
+    (4, 'Full Stack Development', 'Full Stack Development'),
+    (5, 'Data Science', 'Data Science'),
+)
+
+LOOKUPS = (
+    # lookup table, old text column, new id column, code length, values
+    ('application_statuses', 'status', 'status_id', 20, APPLICATION_STATUSES),
+    ('internship_types', 'internship_type', 'internship_type_id', 50, INTERNSHIP_TYPES),
+)
+
+
+def _columns(bind):
+    """internship_applications columns keyed by name"""
+    return {column['name']: column
+            for column in sa.inspect(bind).get_columns('internship_applications')}
+
+
+def upgrade():
+    # MySQL commits each DDL statement immediately, so every step below
+    # checks the current schema and a failed run can simply be rerun
+    bind = op.get_bind()
+    columns = _columns(bind)
+
+    # Refuse unknown values before any schema change
+    for _, old_column, _, _, values in LOOKUPS:
+        if old_column not in columns:
+            continue
+        codes = sa.bindparam('codes', [code for _, code, _ in values], expanding=True)
+        unmapped = bind.execute(
+            sa.text(
+                f'SELECT DISTINCT {old_column} FROM internship_applications '
+                f'WHERE {old_column} IS NOT NULL AND {old_column} NOT IN :codes'
+            ).bindparams(codes)
+        ).scalars().all()
+        if unmapped:
+            raise RuntimeError(
+                f'Cannot migrate internship_applications.{old_column}; '
+                f'unknown values: {unmapped!r}'
+            )
+
+    existing_tables = sa.inspect(bind).get_table_names()
+
+    # The app's startup create_all() may already have created and seeded these
+    for table_name, _, _, code_length, values in LOOKUPS:
+        if table_name not in existing_tables:
+            op.create_table(
+                table_name,
+                sa.Column('id', sa.SmallInteger(), autoincrement=False, nullable=False),
+                sa.Column('code', sa.String(length=code_length), nullable=False),
+                sa.Column('label', sa.String(length=50), nullable=False),
+                sa.PrimaryKeyConstraint('id'),
+                sa.UniqueConstraint('code')
+            )
+        table = sa.table(table_name, sa.column('id'), sa.column('code'), sa.column('label'))
+        seeded = {row.id for row in bind.execute(sa.select(table.c.id))}
+        rows = [{'id': id_, 'code': code, 'label': label}
+                for id_, code, label in values if id_ not in seeded]
+        if rows:
+            op.bulk_insert(table, rows)
+
+    with op.batch_alter_table('internship_applications') as batch_op:
+        for _, _, new_column, _, _ in LOOKUPS:
+            if new_column not in columns:
+                batch_op.add_column(sa.Column(new_column, sa.SmallInteger(), nullable=True))
+
+    # Map each text value to its lookup id
+    for table_name, old_column, new_column, _, _ in LOOKUPS:
+        if old_column in columns:
+            op.execute(
+                f'UPDATE internship_applications SET {new_column} = '
+                f'(SELECT id FROM {table_name} WHERE code = internship_applications.{old_column}) '
+                f'WHERE {new_column} IS NULL'
+            )
+
+    # Old status column was nullable with a 'pending' default
+    if 'status' in columns:
+        op.execute("UPDATE internship_applications SET status_id = 1 WHERE status_id IS NULL")
+
+    columns = _columns(bind)
+    indexes = {index['name'] for index in sa.inspect(bind).get_indexes('internship_applications')}
+    foreign_keys = {fk['name'] for fk in sa.inspect(bind).get_foreign_keys('internship_applications')}
+
+    with op.batch_alter_table('internship_applications') as batch_op:
+        for _, _, new_column, _, _ in LOOKUPS:
+            if columns[new_column]['nullable']:
+                batch_op.alter_column(new_column, existing_type=sa.SmallInteger(), nullable=False)
+            # Indexes first so InnoDB uses them for the foreign keys
+            index_name = f'ix_internship_applications_{new_column}'
+            if index_name not in indexes:
+                batch_op.create_index(index_name, [new_column])
+        for table_name, _, new_column, _, _ in LOOKUPS:
+            fk_name = f'fk_internship_applications_{new_column}'
+            if fk_name not in foreign_keys:
+                batch_op.create_foreign_key(fk_name, table_name, [new_column], ['id'])
+        for _, old_column, _, _, _ in LOOKUPS:
+            if old_column in columns:
+                batch_op.drop_column(old_column)
+
+
+def downgrade():
+    with op.batch_alter_table('internship_applications') as batch_op:
+        batch_op.add_column(sa.Column('status', sa.String(length=20), nullable=True))
+        batch_op.add_column(sa.Column('internship_type', sa.String(length=50), nullable=True))
+
+    for table_name, old_column, new_column, _, _ in LOOKUPS:
+        op.execute(
+            f'UPDATE internship_applications SET {old_column} = '
+            f'(SELECT code FROM {table_name} WHERE id = internship_applications.{new_column})'
+        )
+
+    with op.batch_alter_table('internship_applications') as batch_op:
+        batch_op.alter_column('internship_type', existing_type=sa.String(length=50), nullable=False)
+        # Foreign keys first; MySQL won't drop an index a foreign key needs
+        batch_op.drop_constraint('fk_internship_applications_internship_type_id', type_='foreignkey')
+        batch_op.drop_constraint('fk_internship_applications_status_id', type_='foreignkey')
+        batch_op.drop_index('ix_internship_applications_internship_type_id')
+        batch_op.drop_index('ix_internship_applications_status_id')
+        batch_op.drop_column('internship_type_id')
+        batch_op.drop_column('status_id')
+
+    op.drop_table('internship_types')
+    op.drop_table('application_statuses')
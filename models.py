@@ -5,8 +5,54 @@ Defines User, Admin, and Internship application models
 
 from flask_login import UserMixin
 from datetime import datetime
+from sqlalchemy.types import TypeDecorator
 from app import db
 
+# Lookup values for application status and internship type.
+# Rows store the small integer id; never renumber an existing entry,
+# append new ones instead (and add a migration seeding them).
+APPLICATION_STATUSES = (
+    (1, 'pending', 'Pending'),
+    (2, 'reviewed', 'Reviewed'),
+    (3, 'accepted', 'Accepted'),
+    (4, 'rejected', 'Rejected'),
+)
+
+INTERNSHIP_TYPES = (
+    (1, 'IT Solutions', 'IT Solutions'),
+    (2, 'IoT Development', 'IoT Development'),
+    (3, 'AI & Machine Learning', 'AI & ML'),
+    (4, 'Full Stack Development', 'Full Stack Development'),
+    (5, 'Data Science', 'Data Science'),
+)
+
+class LookupCode(TypeDecorator):
+    """Small integer column exposed as its lookup code string"""
+    impl = db.SmallInteger
+    cache_ok = True
+    
+    def __init__(self, values):
+        super().__init__()
+        self.values = values
+        self.ids = {code: id_ for id_, code, _ in values}
+        self.codes = {id_: code for id_, code, _ in values}
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return self.ids[value]
+        except KeyError:
+            raise ValueError(f'Unknown lookup value: {value!r}')
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return self.codes[value]
+        except KeyError:
+            raise ValueError(f'Unknown lookup id: {value!r}')
+
 class Admin(UserMixin, db.Model):
     """Admin user model for authentication"""
     __tablename__ = 'admins'
@@ -21,6 +67,28 @@ class Admin(UserMixin, db.Model):
     def __repr__(self):
         return f'<Admin {self.username}>'
 
+class ApplicationStatus(db.Model):
+    """Lookup table for application statuses"""
+    __tablename__ = 'application_statuses'
+    
+    id = db.Column(db.SmallInteger, primary_key=True, autoincrement=False)
+    code = db.Column(db.String(20), unique=True, nullable=False)
+    label = db.Column(db.String(50), nullable=False)
+    
+    def __repr__(self):
+        return f'<ApplicationStatus {self.code}>'
+
+class InternshipType(db.Model):
+    """Lookup table for internship domains"""
+    __tablename__ = 'internship_types'
+    
+    id = db.Column(db.SmallInteger, primary_key=True, autoincrement=False)
+    code = db.Column(db.String(50), unique=True, nullable=False)
+    label = db.Column(db.String(50), nullable=False)
+    
+    def __repr__(self):
+        return f'<InternshipType {self.code}>'
+
 class InternshipApplication(db.Model):
     """Model for internship applications"""
     __tablename__ = 'internship_applications'
@@ -32,13 +100,19 @@ class InternshipApplication(db.Model):
     college = db.Column(db.String(200), nullable=False)
     course = db.Column(db.String(100), nullable=False)
     year_of_study = db.Column(db.String(20), nullable=False)
-    internship_type = db.Column(db.String(50), nullable=False)  # IT, IoT, AI
+    internship_type = db.Column('internship_type_id', LookupCode(INTERNSHIP_TYPES),
+                                db.ForeignKey('internship_types.id',
+                                              name='fk_internship_applications_internship_type_id'),
+                                nullable=False, index=True)
     resume_filename = db.Column(db.String(255), nullable=True)
     cover_letter = db.Column(db.Text, nullable=True)
     skills = db.Column(db.Text, nullable=True)
     github_profile = db.Column(db.String(255), nullable=True)
     linkedin_profile = db.Column(db.String(255), nullable=True)
-    status = db.Column(db.String(20), default='pending')  # pending, reviewed, accepted, rejected
+    status = db.Column('status_id', LookupCode(APPLICATION_STATUSES),
+                       db.ForeignKey('application_statuses.id',
+                                     name='fk_internship_applications_status_id'),
+                       nullable=False, default='pending', index=True)
     applied_at = db.Column(db.DateTime, default=datetime.utcnow)
     reviewed_at = db.Column(db.DateTime, nullable=True)
     notes = db.Column(db.Text, nullable=True)  # Admin notes
@@ -5,44 +5,111 @@ Handles admin dashboard and application management
 
 from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, send_from_directory, current_app
 from flask_login import login_required, current_user
-from models import InternshipApplication
+from models import InternshipApplication, APPLICATION_STATUSES, INTERNSHIP_TYPES
 from forms import ApplicationStatusForm
 from app import db
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+from collections import OrderedDict
 from datetime import datetime
 import os
+import threading
+import time
 
 admin_bp = Blueprint('admin', __name__)
 
+# Facet counts for the applications filter bar, keyed by search string
+FACET_CACHE_TTL = 60  # seconds
+FACET_CACHE_SIZE = 128  # searches
+_facet_cache = OrderedDict()
+_facet_cache_lock = threading.Lock()
+_facet_generation = 0  # bumped on every invalidation
+
+@event.listens_for(Session, 'after_flush')
+def _note_application_writes(session, flush_context):
+    """Remember that this transaction wrote applications"""
+    if any(isinstance(obj, InternshipApplication)
+           for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info['facets_stale'] = True
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_facet_cache(session):
+    """Drop cached facet counts once application writes are committed"""
+    global _facet_generation
+    if session.info.pop('facets_stale', False):
+        with _facet_cache_lock:
+            _facet_generation += 1
+            _facet_cache.clear()
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_application_writes(session):
+    """Forget application writes that were rolled back"""
+    session.info.pop('facets_stale', None)
+
+def _search_filter(search):
+    """Filter clause matching applications by name, email or college"""
+    return (InternshipApplication.name.contains(search) |
+            InternshipApplication.email.contains(search) |
+            InternshipApplication.college.contains(search))
+
+def application_facets(search):
+    """Application counts by (status, internship_type) under a search filter"""
+    now = time.monotonic()
+    with _facet_cache_lock:
+        cached = _facet_cache.get(search)
+        generation = _facet_generation
+    if cached and now - cached[0] < FACET_CACHE_TTL:
+        return cached[1]
+    
+    query = db.session.query(
+        InternshipApplication.status,
+        InternshipApplication.internship_type,
+        func.count(InternshipApplication.id)
+    )
+    if search:
+        query = query.filter(_search_filter(search))
+    counts = {
+        (status, internship_type): count
+        for status, internship_type, count in query.group_by(
+            InternshipApplication.status, InternshipApplication.internship_type
+        )
+    }
+    
+    with _facet_cache_lock:
+        # A write committed while querying; these counts may predate it
+        if generation != _facet_generation:
+            return counts
+        _facet_cache[search] = (now, counts)
+        _facet_cache.move_to_end(search)
+        # Drop the oldest searches so the cache stays small
+        while len(_facet_cache) > FACET_CACHE_SIZE:
+            _facet_cache.popitem(last=False)
+    return counts
+
 @admin_bp.route('/dashboard')
 @login_required
 def dashboard():
     """Admin dashboard with application statistics"""
-    # Get application statistics
-    total_applications = InternshipApplication.query.count()
-    pending_applications = InternshipApplication.query.filter_by(status='pending').count()
-    reviewed_applications = InternshipApplication.query.filter_by(status='reviewed').count()
-    accepted_applications = InternshipApplication.query.filter_by(status='accepted').count()
-    rejected_applications = InternshipApplication.query.filter_by(status='rejected').count()
+    # Get application statistics from the cached status x type counts
+    facets = application_facets('')
+    status_counts = {}
+    type_counts = {}
+    for (status, internship_type), count in facets.items():
+        status_counts[status] = status_counts.get(status, 0) + count
+        type_counts[internship_type] = type_counts.get(internship_type, 0) + count
     
     # Get recent applications (last 10)
     recent_applications = InternshipApplication.query.order_by(
         InternshipApplication.applied_at.desc()
     ).limit(10).all()
     
-    # Get applications by internship type
-    it_applications = InternshipApplication.query.filter_by(internship_type='IT Solutions').count()
-    iot_applications = InternshipApplication.query.filter_by(internship_type='IoT Development').count()
-    ai_applications = InternshipApplication.query.filter_by(internship_type='AI & Machine Learning').count()
-    
     stats = {
-        'total': total_applications,
-        'pending': pending_applications,
-        'reviewed': reviewed_applications,
-        'accepted': accepted_applications,
-        'rejected': rejected_applications,
-        'it': it_applications,
-        'iot': iot_applications,
-        'ai': ai_applications
+        'total': sum(facets.values()),
+        'pending': status_counts.get('pending', 0),
+        'reviewed': status_counts.get('reviewed', 0),
+        'accepted': status_counts.get('accepted', 0),
+        'rejected': status_counts.get('rejected', 0),
+        'types': [(label, type_counts.get(code, 0)) for _, code, label in INTERNSHIP_TYPES]
     }
     
     return render_template('admin/dashboard.html', stats=stats, recent_applications=recent_applications)
@@ -56,6 +123,12 @@ def applications():
     type_filter = request.args.get('type', 'all')
     search = request.args.get('search', '')
     
+    # Unknown filter values would be rejected by the lookup columns
+    if status_filter not in {code for _, code, _ in APPLICATION_STATUSES}:
+        status_filter = 'all'
+    if type_filter not in {code for _, code, _ in INTERNSHIP_TYPES}:
+        type_filter = 'all'
+    
     # Build query with filters
     query = InternshipApplication.query
     
@@ -66,11 +139,7 @@ def applications():
         query = query.filter_by(internship_type=type_filter)
     
     if search:
-        query = query.filter(
-            InternshipApplication.name.contains(search) |
-            InternshipApplication.email.contains(search) |
-            InternshipApplication.college.contains(search)
-        )
+        query = query.filter(_search_filter(search))
     
     # Order by application date (newest first) and paginate
     applications = query.order_by(
@@ -79,11 +148,24 @@ def applications():
         page=page, per_page=20, error_out=False
     )
     
+    # Option counts for each dropdown, honouring the other dropdown's filter
+    status_counts = {}
+    type_counts = {}
+    for (status, internship_type), count in application_facets(search).items():
+        if type_filter in ('all', internship_type):
+            status_counts[status] = status_counts.get(status, 0) + count
+        if status_filter in ('all', status):
+            type_counts[internship_type] = type_counts.get(internship_type, 0) + count
+    
     return render_template('admin/applications.html', 
                          applications=applications,
                          status_filter=status_filter,
                          type_filter=type_filter,
-                         search=search)
+                         search=search,
+                         statuses=APPLICATION_STATUSES,
+                         internship_types=INTERNSHIP_TYPES,
+                         status_counts=status_counts,
+                         type_counts=type_counts)
 
 @admin_bp.route('/application/<int:id>')
 @login_required
@@ -134,7 +216,7 @@ def download_resume(id):
 def applications_chart_data():
     """API endpoint for dashboard charts"""
     # Applications by month (last 6 months)
-    from sqlalchemy import func, extract
+    from sqlalchemy import extract
     
     monthly_data = db.session.query(
         extract('month', InternshipApplication.applied_at).label('month'),